@@ -119,21 +119,30 @@ class Config:
     def should_fetch(self, product: str, test_type: str) -> bool:
         """
         Check if product/test_type combination should be fetched.
-        
+
         If filters is empty, all products/test_types are allowed.
         Test type matching uses prefix (CP matches CP, CP1, CP2, etc.)
         """
         if not self.filters:
             return True  # No filters = fetch all
-        
-        for f in self.filters:
-            if f.product == product:
-                # Prefix match for test_type (CP matches CP1, CP2, etc.)
-                for tt in f.test_types:
-                    if test_type.upper().startswith(tt.upper()):
-                        return True
-                return False
-        return False  # Product not in filters, skip it
+
+        # Built once on first call: {product: (uppercase test-type prefixes)}.
+        # should_fetch runs for every remote file during a sync, so the
+        # O(filters) scan is replaced with a dict lookup + one startswith
+        # (which accepts a tuple of prefixes). First filter wins for a
+        # duplicated product, matching the original scan order.
+        prefixes = getattr(self, "_filter_prefixes", None)
+        if prefixes is None:
+            prefixes = {}
+            for f in self.filters:
+                if f.product not in prefixes:
+                    prefixes[f.product] = tuple(tt.upper() for tt in f.test_types)
+            self._filter_prefixes = prefixes
+
+        tts = prefixes.get(product)
+        if tts is None:
+            return False  # Product not in filters, skip it
+        return test_type.upper().startswith(tts)
 
     @classmethod
     def load(cls, config_path: Path | None = None) -> "Config":
@@ -66,6 +66,30 @@ class Database:
         rows = result.fetchall()
         return [dict(zip(columns, row)) for row in rows]
 
+    def query_head(
+        self, sql: str, params: list | None = None, n: int = 100
+    ) -> tuple[list[dict], bool]:
+        """
+        Execute SQL query and return at most the first n rows.
+
+        Fetches n+1 rows instead of the full result, so display-truncated
+        callers (e.g. `stdf db query`) never materialize a multi-million-row
+        result just to show the head.
+
+        Args:
+            sql: SQL query string (use ? or $1 for parameters)
+            params: Query parameters
+            n: Maximum number of rows to return
+
+        Returns:
+            (rows as dictionaries, True if more rows were available)
+        """
+        result = self.conn.execute(sql, params or [])
+        columns = [desc[0] for desc in result.description]
+        rows = result.fetchmany(n + 1)
+        truncated = len(rows) > n
+        return [dict(zip(columns, row)) for row in rows[:n]], truncated
+
     def query_df(self, sql: str, params: list | None = None):
         """
         Execute SQL query and return results as pandas DataFrame.
@@ -77,7 +101,15 @@ class Database:
         Returns:
             Pandas DataFrame with results
         """
-        return self.conn.execute(sql, params or []).fetchdf()
+        # Arrow-first: to_pandas with self_destruct frees each Arrow buffer
+        # as its column is converted, so peak memory is ~1x the result
+        # instead of Arrow + pandas side by side; split_blocks keeps numeric
+        # columns zero-copy views over the Arrow buffers where possible.
+        result = self.conn.execute(sql, params or [])
+        # duckdb >= 1.4 renamed fetch_arrow_table() to to_arrow_table() and
+        # deprecated the old name; keep the fallback for the >=0.9 floor.
+        to_table = getattr(result, "to_arrow_table", None) or result.fetch_arrow_table
+        return to_table().to_pandas(self_destruct=True, split_blocks=True)
 
     def get_lot_summary(self, lot_id: str | None = None) -> list[dict]:
         """Get lot summary with yield information (retest-aware).
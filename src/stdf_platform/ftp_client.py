@@ -1,9 +1,16 @@
 """FTP client for downloading STDF files."""
 
 import ftplib
-import gzip
 import shutil
 import fnmatch
+
+try:
+    # python-isal (pip install stdf2pq[isal]): SIMD gzip, ~2-4x faster
+    # decompression than zlib with the same API. Optional — plain gzip
+    # otherwise.
+    from isal import igzip as gzip
+except ImportError:
+    import gzip
 from pathlib import Path
 from typing import Generator
 
@@ -166,7 +173,9 @@ class FTPClient:
 
             with gzip.open(local_path, "rb") as f_in:
                 with open(decompressed_path, "wb") as f_out:
-                    shutil.copyfileobj(f_in, f_out)
+                    # 1 MiB chunks: the default copy buffer (64 KiB on POSIX)
+                    # makes many small zlib calls on multi-hundred-MB files.
+                    shutil.copyfileobj(f_in, f_out, length=1024 * 1024)
 
             # Remove compressed file
             local_path.unlink()
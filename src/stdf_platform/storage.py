@@ -126,6 +126,16 @@ CHIPID_SCHEMA = pa.schema([
 ])
 
 
+def _table_from_rows(schema: pa.Schema, rows: list[dict]) -> pa.Table:
+    """Build a Table from fully-populated row dicts, deriving the column set
+    from the schema so the field list is not duplicated by hand per call site
+    (and cannot drift from the schema)."""
+    return pa.table(
+        {name: [r[name] for r in rows] for name in schema.names},
+        schema=schema,
+    )
+
+
 def _get_test_category(test_type: str) -> str:
     """Extract test category from test type (CP11 -> CP, FT2 -> FT, PT -> CP)."""
     test_type_upper = test_type.upper()
@@ -225,6 +235,11 @@ class ParquetStorage:
                 tmp,
                 compression=compression,
                 version="2.6",  # default dictionary encoding (no BSS/DELTA — see docstring)
+                # 256k-row groups (vs pyarrow's 1M default): DuckDB parallelizes
+                # a Parquet scan per row group and prunes per row-group zone
+                # maps, so big test_data files get 4x the scan granularity for
+                # negligible size overhead. Small tables fit one group as before.
+                row_group_size=256 * 1024,
                 use_dictionary=True,
                 write_statistics=True,
                 coerce_timestamps="ms",  # Millisecond precision
@@ -507,6 +522,21 @@ class ParquetStorage:
                 )
                 part_txt_map[part_id] = part.get("part_txt", "")
 
+            # Test metadata flattened to one tuple per test_num up front — the
+            # row loop below otherwise pays five test_info.get calls per row
+            # to re-extract values that are constant per test.
+            _no_meta = ("", "PTR", None, None, "")
+            test_meta: dict[int, tuple] = {
+                tn: (
+                    info.get("test_name", ""),
+                    info.get("rec_type", "PTR"),
+                    info.get("lo_limit"),
+                    info.get("hi_limit"),
+                    info.get("units", ""),
+                )
+                for tn, info in data.tests.items()
+            }
+
             result_groups: dict[tuple, list] = {}
             for result in data.test_results:
                 key = (result.get("lot_id", ""), result.get("wafer_id", ""))
@@ -524,69 +554,65 @@ class ParquetStorage:
                 )
                 result_path.mkdir(parents=True, exist_ok=True)
 
-                enriched = []
+                # Column-oriented (SoA) accumulation: values go straight into
+                # per-column lists, skipping the intermediate 19-key dict per
+                # row — test_data is millions of rows per file and those dicts
+                # dominated the save path's allocations and peak memory.
+                cols: dict[str, list] = {name: [] for name in TEST_DATA_SCHEMA.names}
+                # Bind each column's append once, in schema order — the loop
+                # below runs once per test result, so 19 dict + attribute
+                # lookups per row are measurable at that volume.
+                (app_lot_id, app_wafer_id, app_part_id, app_part_txt,
+                 app_x, app_y, app_test_num, app_test_name, app_rec_type,
+                 app_lo, app_hi, app_units, app_result, app_passed,
+                 app_retest, app_pin_num, app_pin_name, app_exec_seq,
+                 app_flag) = (cols[n].append for n in TEST_DATA_SCHEMA.names)
                 # exec_seq = 0-based occurrence order of the flag key within
                 # this run (file record order). The counter dict mirrors the
                 # flag key in views._DEDUP_UNIT (plus test_num/pin_num) so loop
                 # measurements (e.g. an OTP dump writing 512 PTRs under one
                 # test_num) get distinct 0,1,2... instead of colliding.
                 seq_counters: dict[tuple, int] = {}
+                meta_get = test_meta.get
+                coords_get = part_coords.get
+                txt_get = part_txt_map.get
+                seq_get = seq_counters.get
                 for r in results:
                     test_num = r.get("test_num", 0)
-                    test_info = data.tests.get(test_num, {})
+                    test_name, rec_type, lo_limit, hi_limit, units = meta_get(
+                        test_num, _no_meta
+                    )
                     part_id = r.get("part_id", "")
-                    x_coord, y_coord = part_coords.get(part_id, (-32768, -32768))
-                    part_txt = part_txt_map.get(part_id, "")
+                    x_coord, y_coord = coords_get(part_id, (-32768, -32768))
+                    part_txt = txt_get(part_id, "")
                     ft_txt = part_txt if x_coord == -32768 and y_coord == -32768 else ""
                     pin_num = r.get("pin_num")
                     flag_key = (wafer_id, x_coord, y_coord, ft_txt, test_num, pin_num)
-                    exec_seq = seq_counters.get(flag_key, 0)
+                    exec_seq = seq_get(flag_key, 0)
                     seq_counters[flag_key] = exec_seq + 1
-                    enriched.append({
-                        "lot_id": r.get("lot_id", ""),
-                        "wafer_id": r.get("wafer_id", ""),
-                        "part_id": part_id,
-                        "part_txt": part_txt,
-                        "x_coord": x_coord,
-                        "y_coord": y_coord,
-                        "test_num": test_num,
-                        "test_name": test_info.get("test_name", ""),
-                        "rec_type": test_info.get("rec_type", "PTR"),
-                        "lo_limit": test_info.get("lo_limit"),
-                        "hi_limit": test_info.get("hi_limit"),
-                        "units": test_info.get("units", ""),
-                        "result": r.get("result"),
-                        "passed": "P" if r.get("passed", False) else "F",
-                        "retest_num": retest_num,
-                        "pin_num": pin_num,
-                        "pin_name": r.get("pin_name"),
-                        "exec_seq": exec_seq,
-                        "retest_flag": 0,
-                    })
+                    app_lot_id(r.get("lot_id", ""))
+                    app_wafer_id(r.get("wafer_id", ""))
+                    app_part_id(part_id)
+                    app_part_txt(part_txt)
+                    app_x(x_coord)
+                    app_y(y_coord)
+                    app_test_num(test_num)
+                    app_test_name(test_name)
+                    app_rec_type(rec_type)
+                    app_lo(lo_limit)
+                    app_hi(hi_limit)
+                    app_units(units)
+                    app_result(r.get("result"))
+                    app_passed("P" if r.get("passed", False) else "F")
+                    app_retest(retest_num)
+                    app_pin_num(pin_num)
+                    app_pin_name(r.get("pin_name"))
+                    app_exec_seq(exec_seq)
+                    app_flag(0)
 
                 new_keys = set(seq_counters.keys())
 
-                result_table = pa.table({
-                    "lot_id": [r["lot_id"] for r in enriched],
-                    "wafer_id": [r["wafer_id"] for r in enriched],
-                    "part_id": [r["part_id"] for r in enriched],
-                    "part_txt": [r["part_txt"] for r in enriched],
-                    "x_coord": [r["x_coord"] for r in enriched],
-                    "y_coord": [r["y_coord"] for r in enriched],
-                    "test_num": [r["test_num"] for r in enriched],
-                    "test_name": [r["test_name"] for r in enriched],
-                    "rec_type": [r["rec_type"] for r in enriched],
-                    "lo_limit": [r["lo_limit"] for r in enriched],
-                    "hi_limit": [r["hi_limit"] for r in enriched],
-                    "units": [r["units"] for r in enriched],
-                    "result": [r["result"] for r in enriched],
-                    "passed": [r["passed"] for r in enriched],
-                    "retest_num": [r["retest_num"] for r in enriched],
-                    "pin_num": [r["pin_num"] for r in enriched],
-                    "pin_name": [r["pin_name"] for r in enriched],
-                    "exec_seq": [r["exec_seq"] for r in enriched],
-                    "retest_flag": [r["retest_flag"] for r in enriched],
-                }, schema=TEST_DATA_SCHEMA)
+                result_table = pa.table(cols, schema=TEST_DATA_SCHEMA)
                 self._write_parquet(result_table, result_path / "data.parquet", compression)
 
                 if retest_num > 0 and new_keys:
@@ -637,22 +663,7 @@ class ParquetStorage:
                         **decoded,
                     })
 
-                chip_table = pa.table({
-                    "lot_id": [r["lot_id"] for r in rows],
-                    "part_id": [r["part_id"] for r in rows],
-                    "part_txt": [r["part_txt"] for r in rows],
-                    "chip_occurrence_index": [r["chip_occurrence_index"] for r in rows],
-                    "efuse_raw": [r["efuse_raw"] for r in rows],
-                    "valid": [r["valid"] for r in rows],
-                    "origin_fab_code": [r["origin_fab_code"] for r in rows],
-                    "origin_fab": [r["origin_fab"] for r in rows],
-                    "origin_lot": [r["origin_lot"] for r in rows],
-                    "origin_wafer": [r["origin_wafer"] for r in rows],
-                    "origin_x": [r["origin_x"] for r in rows],
-                    "origin_y": [r["origin_y"] for r in rows],
-                    "reserved_bits": [r["reserved_bits"] for r in rows],
-                    "retest_num": [r["retest_num"] for r in rows],
-                }, schema=CHIPID_SCHEMA)
+                chip_table = _table_from_rows(CHIPID_SCHEMA, rows)
                 self._write_parquet(chip_table, chip_path / "data.parquet", compression)
 
             counts["chipid"] = len(data.chip_ids)
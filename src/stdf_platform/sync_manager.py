@@ -1,6 +1,7 @@
 """Sync manager for tracking downloaded and ingested STDF files."""
 
 import json
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
@@ -20,6 +21,8 @@ class SyncManager:
         """
         self.history_file = history_file
         self._history: dict = {"files": {}}
+        self._defer = False
+        self._dirty = False
         self._load()
 
     def _load(self) -> None:
@@ -32,9 +35,32 @@ class SyncManager:
                 self._history = {"files": {}}
 
     def _save(self) -> None:
-        """Save history atomically."""
+        """Save history atomically (deferred inside defer_saves())."""
+        if self._defer:
+            self._dirty = True
+            return
         atomic_write_json(self.history_file, self._history)
 
+    @contextmanager
+    def defer_saves(self):
+        """Batch history writes: one JSON dump on exit instead of per mark.
+
+        Each mark_* call rewrites the whole history file; during a large sync
+        that is O(N) bytes per file, O(N²) total. Inside this context marks
+        only flip a dirty flag and the file is written once on exit (also on
+        error, so completed work is kept). A crash mid-batch loses at most
+        this batch's bookkeeping — the affected files simply re-download or
+        re-ingest on the next sync, which is harmless.
+        """
+        self._defer = True
+        try:
+            yield self
+        finally:
+            self._defer = False
+            if self._dirty:
+                self._dirty = False
+                self._save()
+
     def is_downloaded(self, remote_path: str) -> bool:
         """
         Check if a file has already been downloaded.
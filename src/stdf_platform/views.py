@@ -54,6 +54,11 @@ def setup_views(
     Returns the list of registered view names (base tables and the *_final
     dedup views that were created).
     """
+    # Every query in a session hits the same Parquet files through these
+    # views; the object cache keeps their footer/metadata parsed across
+    # queries on this connection instead of re-reading it per statement.
+    conn.execute("SET enable_object_cache = true")
+
     registered: list[str] = []
     for table in ["lots", "wafers", "parts", "test_data", "chipid"]:
         path = data_dir / table
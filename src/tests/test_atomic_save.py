@@ -21,6 +21,24 @@ def test_sync_manager_save_is_atomic_and_clean(tmp_path):
     assert leftovers == []
 
 
+def test_sync_manager_defer_saves_writes_once_on_exit(tmp_path):
+    hist = tmp_path / "sync_history.json"
+    mgr = SyncManager(hist)
+
+    with mgr.defer_saves():
+        mgr.mark_downloaded("remote/a.stdf", tmp_path / "a.stdf", "PROD", "CP")
+        mgr.mark_downloaded("remote/b.stdf", tmp_path / "b.stdf", "PROD", "CP")
+        # Nothing persisted while deferring.
+        assert not hist.exists()
+
+    data = json.loads(hist.read_text(encoding="utf-8"))
+    assert set(data["files"]) == {"remote/a.stdf", "remote/b.stdf"}
+
+    # Saves go back to immediate after the context.
+    mgr.mark_downloaded("remote/c.stdf", tmp_path / "c.stdf", "PROD", "FT")
+    assert SyncManager(hist).is_downloaded("remote/c.stdf")
+
+
 def test_ingest_history_save_is_atomic_and_clean(tmp_path):
     hist = tmp_path / "ingest_history.json"
     h = IngestHistory(hist)
@@ -65,3 +65,16 @@ def test_export_lot_pivot(tmp_path, monkeypatch):
     header = out.read_text().splitlines()[0]
     assert "VDD" in header  # pivoted test_name becomes a column
     assert "part_id" in header
+
+
+def test_export_lot_pivot_parquet(tmp_path, monkeypatch):
+    _write(tmp_path)
+    monkeypatch.setattr(cli.Config, "load", classmethod(lambda cls, p=None: _patched_config(tmp_path)))
+    out = tmp_path / "pivot.parquet"
+    result = CliRunner().invoke(
+        cli.main, ["export", "lot", "LOT1", str(out), "-f", "parquet"]
+    )
+    assert result.exit_code == 0, result.output
+    table = pq.read_table(out)
+    assert "VDD" in table.column_names
+    assert table.column("part_id").to_pylist() == ["P0"]
@@ -0,0 +1,24 @@
+"""parser.parse must stream-inflate .gz inputs identically to plain files."""
+
+import gzip
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+from make_test_stdf import make_ft_stdf  # noqa: E402
+
+from stdf_platform.parser import parse_stdf  # noqa: E402
+
+
+def test_gz_parses_identically(tmp_path):
+    plain = tmp_path / "ft.stdf"
+    make_ft_stdf(plain, "GZLOT", parts=3)
+    gz = tmp_path / "ft.stdf.gz"
+    gz.write_bytes(gzip.compress(plain.read_bytes()))
+
+    a = parse_stdf(plain)
+    b = parse_stdf(gz)
+
+    assert b.lot_id == a.lot_id == "GZLOT"
+    assert len(b.parts) == len(a.parts) == 3
+    assert b.test_results == a.test_results
@@ -1,5 +1,7 @@
 """Query-server endpoint + connection-lockdown tests over synthetic Parquet."""
 
+import csv
+import io
 import sys
 from pathlib import Path
 
@@ -71,9 +73,9 @@ def test_query_csv_format(tmp_path):
     )
     assert resp.status_code == 200
     assert resp.headers["content-type"].startswith("text/csv")
-    lines = resp.text.strip().splitlines()
-    assert lines[0] == "lot_id"
-    assert lines[1] == "LOT1"
+    rows = list(csv.reader(io.StringIO(resp.text)))
+    assert rows[0] == ["lot_id"]
+    assert rows[1] == ["LOT1"]
 
 
 def test_non_select_rejected(tmp_path):